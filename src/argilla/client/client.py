@@ -126,7 +126,9 @@ class Argilla:
             extra_headers: Extra HTTP headers sent to the server. You can use this to customize
                 the headers of argilla client requests, like additional security restrictions. Default: `None`.
             httpx_extra_kwargs: Extra kwargs passed to the `httpx.Client` constructor. For more information about the
-                available arguments, see https://www.python-httpx.org/api/#client. Defaults to `None`.
+                available arguments, see https://www.python-httpx.org/api/#client. By default, the client keeps up to 50
+                connections alive, and uses HTTP/2 if the `h2` package is installed (`pip install httpx[http2]`).
+                Defaults to `None`.
         """
         from argilla.client.login import ArgillaCredentials
 
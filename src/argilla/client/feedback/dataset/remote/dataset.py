@@ -38,6 +38,7 @@ from argilla.client.sdk.commons.errors import AlreadyExistsApiError
 from argilla.client.sdk.users.models import UserRole
 from argilla.client.sdk.v1.datasets import api as datasets_api_v1
 from argilla.client.sdk.v1.datasets.models import FeedbackRecordsSearchVectorQuery
+from argilla.client.sdk.v1.metadata_properties import api as metadata_properties_api_v1
 from argilla.client.sdk.v1.vectors_settings import api as vectors_settings_api_v1
 from argilla.client.utils import allowed_for_roles
 
@@ -788,12 +789,14 @@ class RemoteFeedbackDataset(FeedbackDatasetBase[RemoteFeedbackRecord], MetricsMi
                 f" The existing metadata properties are: {existing_metadata_property_names}."
             )
 
-        deleted_metadata_properties = []
-        for metadata_property in existing_metadata_properties:
-            if metadata_property.name in metadata_properties:
-                ArgillaMetadataPropertiesMixin.delete(client=self._client, metadata_property_id=metadata_property.id)
-                metadata_properties.remove(metadata_property.name)
-                deleted_metadata_properties.append(metadata_property)
+        deleted_metadata_properties = [
+            metadata_property
+            for metadata_property in existing_metadata_properties
+            if metadata_property.name in metadata_properties
+        ]
+        metadata_properties_api_v1.delete_metadata_properties(
+            client=self._client, ids=[metadata_property.id for metadata_property in deleted_metadata_properties]
+        )
         return deleted_metadata_properties if len(deleted_metadata_properties) > 1 else deleted_metadata_properties[0]
 
     @allowed_for_roles(roles=[UserRole.owner, UserRole.admin])
@@ -14,13 +14,21 @@
 
 """This module contains metrics to gather information related to inter-Annotator agreement. """
 
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+import warnings
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
 from nltk.metrics.agreement import AnnotationTask as NLTKAnnotationTask
 from nltk.metrics.distance import binary_distance, interval_distance, masi_distance
 
 from argilla.client.feedback.dataset import FeedbackDataset
-from argilla.client.feedback.metrics.base import AgreementMetricResult, AnnotationTaskMetricBase, MetricBase
+from argilla.client.feedback.metrics.base import (
+    AgreementMetricResult,
+    AnnotationTaskMetricBase,
+    MetricBase,
+    get_max_value_counts_block_size,
+)
 from argilla.client.feedback.schemas import (
     LabelQuestion,
     MultiLabelQuestion,
@@ -241,12 +249,39 @@ class AgreementMetric(MetricBase):
 class NLTKAnnotationTaskMetric(NLTKAnnotationTask, AnnotationTaskMetricBase):
     """Base class for metrics that use the nltk's AnnotationTask class.
 
-    These metrics make use of a distance function to compute the distance between
+    Deprecated:
+        `KrippendorfAlpha` no longer inherits from this class, and it will be removed in a
+        future release. Subclass `AnnotationTaskMetricBase` instead.
+    """
+
+    def __init__(self, annotated_dataset: "FormattedResponses" = None, distance_function: Callable = None) -> None:
+        warnings.warn(
+            "`NLTKAnnotationTaskMetric` is deprecated and will be removed in future releases."
+            " Subclass `AnnotationTaskMetricBase` instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        AnnotationTaskMetricBase.__init__(
+            self, annotated_dataset=annotated_dataset, distance_function=distance_function
+        )
+        super().__init__(data=annotated_dataset, distance=distance_function)
+
+
+class KrippendorfAlpha(AnnotationTaskMetricBase):
+    """Krippendorf's alpha agreement metric.
+
+    Is a statistical measure of the inter-annotator agreement achieved when coding a set
+    of units of analysis.
+
+    To interpret the results from this metric, we refer the reader to the wikipedia entry.
+    The common consensus dictates that a value of alpha >= 0.8 indicates a reliable annotation,
+    a value >= 0.667 can only guarantee tentative conclusions, while lower values suggest an
+    unreliable annotation.
 
-    It is often the case that we don't want to treat two different
-    labels as complete disagreement, and so the AnnotationTask constructor can also
-    take a distance metric as a final argument. Distance metrics are functions that take two
-    arguments, and return a value between 0.0 and 1.0 indicating the distance between them.
+    The metric makes use of a distance function to compute the distance between the labels,
+    as it is often the case that we don't want to treat two different labels as complete
+    disagreement. Distance functions take two arguments, and return a value between 0.0 and 1.0
+    indicating the distance between them (or the squared difference for interval data).
 
     By default, the following distance metrics are provided for each type of question:
 
@@ -295,36 +330,102 @@ class NLTKAnnotationTaskMetric(NLTKAnnotationTask, AnnotationTaskMetricBase):
         ((1, 2, 3), (3, 2, 1)) 1.0
         ((1, 3, 2), (1, 3, 2)) 0.0
         ...
-    """
 
-    def __init__(self, annotated_dataset: "FormattedResponses" = None, distance_function: Callable = None) -> None:
-        AnnotationTaskMetricBase.__init__(
-            self, annotated_dataset=annotated_dataset, distance_function=distance_function
-        )
-        super().__init__(data=annotated_dataset, distance=distance_function)
-
-
-class KrippendorfAlpha(NLTKAnnotationTaskMetric):
-    """Krippendorf's alpha agreement metric.
-
-    Is a statistical measure of the inter-annotator agreement achieved when coding a set
-    of units of analysis.
-
-    To interpret the results from this metric, we refer the reader to the wikipedia entry.
-    The common consensus dictates that a value of alpha >= 0.8 indicates a reliable annotation,
-    a value >= 0.667 can only guarantee tentative conclusions, while lower values suggest an
-    unreliable annotation.
+    The computation follows the coincidence matrix formulation of the metric: the responses are
+    counted in a `(n_items, n_labels)` matrix, processed by blocks of items, from which the
+    coincidences between labels are obtained with matrix products, and the observed and expected
+    disagreements are weighted by the distance between every pair of labels.
 
     See Also:
         - Take a look at this metric definition:
         https://en.wikipedia.org/wiki/Krippendorff%27s_alpha
 
-        - We use the implementation from nltk:
+        - The results are equivalent to the implementation from nltk:
         https://www.nltk.org/api/nltk.metrics.agreement.html#nltk.metrics.agreement.AnnotationTask.alpha
     """
 
-    def _compute(self, dataset) -> float:
-        return self.alpha()
+    def _pre_process(self, data: "FormattedResponses") -> Tuple[np.ndarray, np.ndarray, pd.Index, np.ndarray]:
+        """Encodes the items and labels as integers, and computes the distances between the labels.
+
+        Args:
+            data: annotated dataset, as a list of tuples of (user_id, item, label).
+
+        Returns:
+            item_codes: the code of the item of each response, sorted.
+            label_codes: the code of the label of each response, in the same order as `item_codes`.
+            labels: the labels corresponding to each label code.
+            distances: matrix of shape `(n_labels, n_labels)` with the distance between each pair of labels.
+        """
+        if len(data) == 0:
+            raise ValueError("Cannot calculate alpha, no data present!")
+
+        coders = pd.Series([coder for coder, _, _ in data], dtype=object)
+        items = pd.Series([item for _, item, _ in data], dtype=object)
+        values = pd.Series([value for _, _, value in data], dtype=object)
+
+        if coders.nunique() == 1 and items.nunique() == 1 and values.nunique() > 1:
+            raise ValueError("Cannot calculate alpha, only one coder and item present!")
+
+        item_codes, _ = pd.factorize(items)
+        label_codes, labels = pd.factorize(values)
+        # Sort the responses by item, so the items can be processed in contiguous blocks
+        order = np.argsort(item_codes, kind="stable")
+        return item_codes[order], label_codes[order], labels, self._distance_matrix(labels)
+
+    @staticmethod
+    def _iter_value_counts(item_codes: np.ndarray, label_codes: np.ndarray, num_labels: int) -> Iterator[np.ndarray]:
+        """Iterates over the `(n_items, n_labels)` matrix of label counts per item by blocks of items.
+
+        Only one block of at most `get_max_value_counts_block_size()` cells is kept in memory at once, as
+        the whole matrix can be huge for questions with many different labels, such as `MultiLabelQuestion`
+        or `RankingQuestion`.
+
+        Args:
+            item_codes: the code of the item of each response, sorted.
+            label_codes: the code of the label of each response, in the same order as `item_codes`.
+            num_labels: the number of unique labels.
+
+        Yields:
+            value_counts: matrix of shape `(n_block_items, n_labels)` with the number of times each label
+                was given to each item of the block.
+        """
+        num_items = item_codes[-1] + 1
+        block_size = max(1, get_max_value_counts_block_size() // num_labels)
+        for start in range(0, num_items, block_size):
+            end = min(start + block_size, num_items)
+            lower, upper = np.searchsorted(item_codes, [start, end])
+            # Each pair of item and label is encoded as a single index of the flattened block
+            cells = (item_codes[lower:upper] - start).astype(np.int64) * num_labels + label_codes[lower:upper]
+            yield np.bincount(cells, minlength=(end - start) * num_labels).reshape(-1, num_labels)
+
+    def _compute(self, data: Tuple[np.ndarray, np.ndarray, pd.Index, np.ndarray]) -> float:
+        item_codes, label_codes, labels, distances = data
+        num_labels = len(labels)
+        if num_labels == 1:
+            return 1.0
+
+        label_totals = np.zeros(num_labels, dtype=np.int64)
+        coincidences = np.zeros((num_labels, num_labels), dtype=float)
+        for value_counts in self._iter_value_counts(item_codes, label_codes, num_labels):
+            # Items with a single response are not pairable, so they don't contribute to the metric
+            labels_per_item = value_counts.sum(axis=1)
+            pairable = labels_per_item > 1
+            value_counts, labels_per_item = value_counts[pairable], labels_per_item[pairable]
+
+            label_totals += value_counts.sum(axis=0)
+            weighted_counts = value_counts / (labels_per_item - 1)[:, None]
+            coincidences += weighted_counts.T @ value_counts
+            coincidences[np.diag_indices(num_labels)] -= weighted_counts.sum(axis=0)
+
+        total = label_totals.sum()
+        if total == 0:
+            raise ValueError("Cannot calculate alpha, there are no items with more than one response!")
+        if np.count_nonzero(label_totals) == 1:
+            return 1.0
+
+        observed_disagreement = (coincidences * distances).sum() / total
+        expected_disagreement = (label_totals @ distances @ label_totals) / (total * (total - 1))
+        return float(1.0 - observed_disagreement / expected_disagreement)
 
 
 METRICS_PER_QUESTION = {
@@ -278,18 +278,13 @@ class AccuracyMetric(AnnotatorMetricBase):
 
     Which proportion of the responses are equal to the suggestions offered.
 
-    We use the implementation in:
+    It is computed as the trace of the confusion matrix over the number of responses, equivalent to:
     https://scikit-learn.org/stable/modules/generated/sklearn.metrics.accuracy_score.html#sklearn.metrics.accuracy_score
-
-    In multilabel classification, this function computes subset accuracy: the set of labels predicted for a
-    sample must exactly match the corresponding set of labels in y_true
     """
 
-    @requires_dependencies("scikit-learn")
     def _compute(self, responses, suggestions):
-        from sklearn.metrics import accuracy_score
-
-        return accuracy_score(y_true=responses, y_pred=suggestions)
+        confusion_matrix, _ = self._get_confusion_matrix(responses, suggestions)
+        return float(np.trace(confusion_matrix) / confusion_matrix.sum())
 
 
 class PrecisionMetric(AnnotatorMetricBase):
@@ -442,17 +437,10 @@ class ConfusionMatrixMetric(AnnotatorMetricBase):
     In case of multiclass classification, this function returns a confusion matrix class-wise.
     """
 
-    @requires_dependencies("scikit-learn")
     def _compute(self, responses, suggestions):
-        import pandas as pd
-        from sklearn.metrics import confusion_matrix
-
-        unique_responses = sorted(np.unique(responses))
-        unique_suggestions = sorted(np.unique(suggestions))
-        labels = sorted(set(unique_responses).union(set(unique_suggestions)))
+        result, labels = self._get_confusion_matrix(responses, suggestions)
         labels_index = [f"responses_{label}" for label in labels]
         labels_columns = [f"suggestions_{label}" for label in labels]
-        result = confusion_matrix(y_true=responses, y_pred=suggestions, labels=labels)
         return pd.DataFrame(result, index=labels_index, columns=labels_columns)
 
 
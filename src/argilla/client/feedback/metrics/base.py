@@ -12,10 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from nltk.metrics.distance import binary_distance, interval_distance
 
 from argilla.client.feedback.schemas.remote.shared import RemoteSchema
 from argilla.pydantic_v1 import BaseModel
@@ -30,6 +34,31 @@ Suggestions = Responses
 # Expected format for the nltk's AnnotationTask
 FormattedResponses = List[Tuple[Any, Hashable, Hashable]]
 
+# Default maximum number of cells of the `(n_items, n_labels)` label counts matrix kept in memory at once
+MAX_VALUE_COUNTS_BLOCK_SIZE = 2**22
+
+
+def get_max_value_counts_block_size() -> int:
+    """Returns the maximum number of cells of the label counts matrix kept in memory at once.
+
+    It can be set with the `ARGILLA_METRICS_MAX_BLOCK_SIZE` environment variable, otherwise or if
+    the value is not a positive integer, `MAX_VALUE_COUNTS_BLOCK_SIZE` is used.
+    """
+    value = os.environ.get("ARGILLA_METRICS_MAX_BLOCK_SIZE")
+    if value is None:
+        return MAX_VALUE_COUNTS_BLOCK_SIZE
+    try:
+        block_size = int(value)
+    except ValueError:
+        block_size = 0
+    if block_size < 1:
+        warnings.warn(
+            f"`ARGILLA_METRICS_MAX_BLOCK_SIZE` must be a positive integer, but got {value!r}."
+            f" Using the default value of {MAX_VALUE_COUNTS_BLOCK_SIZE} instead."
+        )
+        return MAX_VALUE_COUNTS_BLOCK_SIZE
+    return block_size
+
 
 class MetricResultBase(BaseModel):
     """Base class for the result of a metric."""
@@ -89,6 +118,47 @@ class AnnotatorMetricBase(ABC):
         """
         return responses, suggestions
 
+    def _factorize(self, responses: Responses, suggestions: Suggestions) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+        """Encodes the responses and suggestions as integer codes over their shared set of labels.
+
+        The values are kept as objects, so labels of different types (e.g. `1` and `"1"`) are not
+        merged. The labels are sorted, so the code `i` corresponds to `labels[i]`.
+
+        Args:
+            responses: Responses given by the user.
+            suggestions: Suggestions offered for the annotators.
+
+        Raises:
+            ValueError: If the number of responses and suggestions differ, or any of them is missing.
+
+        Returns:
+            Tuple with the codes of the responses, the codes of the suggestions and the labels.
+        """
+        if len(responses) != len(suggestions):
+            raise ValueError(
+                f"The number of responses ({len(responses)}) and suggestions ({len(suggestions)}) must be the same."
+            )
+        codes, labels = pd.factorize(pd.Series([*responses, *suggestions], dtype=object), sort=True)
+        if (codes < 0).any():
+            raise ValueError("The responses and suggestions cannot contain missing values.")
+        return codes[: len(responses)], codes[len(responses) :], labels
+
+    def _get_confusion_matrix(self, responses: Responses, suggestions: Suggestions) -> Tuple[np.ndarray, pd.Index]:
+        """Computes the `k x k` confusion matrix, with the responses as rows and the suggestions as columns.
+
+        Args:
+            responses: Responses given by the user.
+            suggestions: Suggestions offered for the annotators.
+
+        Returns:
+            Tuple with the counts of each pair of labels, indexed by the codes from `_factorize`, and the labels.
+        """
+        codes_r, codes_s, labels = self._factorize(responses, suggestions)
+        k = len(labels)
+        # Each pair of labels is encoded as a single index of the flattened matrix
+        pairs = codes_r.astype(np.int64) * k + codes_s
+        return np.bincount(pairs, minlength=k * k).reshape(k, k), labels
+
     @abstractmethod
     def _compute(self, responses: Responses, suggestions: Suggestions, **kwargs):
         """Abstract method where the computation is done.
@@ -140,6 +210,27 @@ class AnnotationTaskMetricBase(ABC):
         """
         return data
 
+    def _distance_matrix(self, labels: Sequence[Hashable]) -> np.ndarray:
+        """Computes the distance between every pair of labels.
+
+        The distance function is evaluated once per pair of unique labels, so the metrics can
+        work with integer coded labels and look the distances up, instead of calling the
+        distance function for every pair of responses.
+
+        Args:
+            labels: the unique labels found in the dataset.
+
+        Returns:
+            distances: matrix of shape `(n_labels, n_labels)` where `distances[i, j]` is the
+                distance between the labels `labels[i]` and `labels[j]`.
+        """
+        if self._distance_function is binary_distance:
+            return 1.0 - np.eye(len(labels))
+        if self._distance_function is interval_distance:
+            levels = np.asarray(labels, dtype=float)
+            return np.subtract.outer(levels, levels) ** 2
+        return np.array([[self._distance_function(a, b) for b in labels] for a in labels], dtype=float)
+
     @abstractmethod
     def _compute(self, data: FormattedResponses):
         """Abstract method where the computation is done.
@@ -169,11 +260,11 @@ class MetricBase:
         """
         self._dataset = dataset
         self._question_name = question_name
-        self._question_type = type(self._dataset.question_by_name(question_name))
-
+        question = self._dataset.question_by_name(question_name)
         # Check to assume the remote questions behave just like local ones
-        if issubclass(self._question_type, RemoteSchema):
-            self._question_type = type(self._dataset.question_by_name(question_name).to_local())
+        if isinstance(question, RemoteSchema):
+            question = question.to_local()
+        self._question_type = type(question)
 
         if allowed_metrics := self._metrics_per_question.get(self._question_type):
             self._allowed_metrics = allowed_metrics
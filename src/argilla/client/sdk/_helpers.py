@@ -20,6 +20,12 @@ from argilla.client.sdk.commons.errors import WrongResponseError
 from argilla.client.sdk.commons.errors_handler import handle_response_error
 from argilla.client.sdk.commons.models import ErrorMessage, HTTPValidationError, Response
 
+try:
+    # `orjson` is not a dependency of `argilla`, but if installed its faster parser is used
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 def build_raw_response(response: httpx.Response) -> Response[Union[Dict[str, Any], ErrorMessage, HTTPValidationError]]:
     return build_typed_response(response)
@@ -15,6 +15,7 @@
 import dataclasses
 import datetime
 import functools
+import importlib.util
 import inspect
 import json
 import uuid
@@ -28,6 +29,11 @@ from argilla._constants import API_KEY_HEADER_NAME
 from argilla.client.sdk._helpers import build_raw_response
 from argilla.client.sdk.commons.errors import BaseClientError
 
+# Connections are kept alive and reused across requests, to avoid a TCP/TLS handshake per API call
+DEFAULT_HTTPX_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# HTTP/2 multiplexes the requests over a single connection, but requires the `h2` package
+DEFAULT_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 @dataclasses.dataclass
 class _ClientCommonDefaults:
@@ -101,7 +107,7 @@ class Client(_ClientCommonDefaults, _Client):
             headers=self.get_headers(),
             cookies=self.get_cookies(),
             timeout=self.get_timeout(),
-            **self.httpx_extra_kwargs,
+            **{"http2": DEFAULT_HTTP2, "limits": DEFAULT_HTTPX_LIMITS, **self.httpx_extra_kwargs},
         )
         # TODO: Remove this NOW!!!!
         self.__http_async__ = httpx.AsyncClient(
@@ -12,11 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Union
 from uuid import UUID
 
 import httpx
 
+from argilla.client.sdk._helpers import json_loads
 from argilla.client.sdk.commons.errors_handler import handle_response_error
 from argilla.client.sdk.commons.models import ErrorMessage, HTTPValidationError, Response
 from argilla.client.sdk.v1.metadata_properties.models import FeedbackMetadataPropertyModel
@@ -42,11 +45,37 @@ def delete_metadata_property(
 
     if response.status_code == 200:
         response_obj = Response.from_httpx_response(response)
-        response_obj.parsed = FeedbackMetadataPropertyModel.parse_raw(response.content)
+        response_obj.parsed = FeedbackMetadataPropertyModel.parse_obj(json_loads(response.content))
         return response_obj
     return handle_response_error(response)
 
 
+def delete_metadata_properties(
+    client: httpx.Client, ids: List[UUID], max_workers: int = 16
+) -> List[Response[Union[FeedbackMetadataPropertyModel, ErrorMessage, HTTPValidationError]]]:
+    """Sends concurrent DELETE requests to `/api/v1/metadata_properties/{id}` endpoint to delete
+    several metadata properties from a `FeedbackTask` dataset in Argilla.
+
+    The requests are sent from a pool of threads sharing the same client, so the latency of
+    each request overlaps with the others instead of adding up.
+
+    Args:
+        client: the authenticated Argilla client to be used to send the requests to the API.
+        ids: the ids of the metadata properties to be deleted in Argilla.
+        max_workers: the maximum number of requests sent concurrently. Defaults to `16`.
+
+    Returns:
+        A list of `Response` objects, in the same order as `ids`, containing a `parsed`
+        attribute with the parsed response if the request was successful, which is a
+        `FeedbackMetadataPropertyModel`.
+    """
+    if len(ids) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+        return list(executor.map(partial(delete_metadata_property, client), ids))
+
+
 def update_metadata_property(
     client: httpx.Client,
     id: UUID,
@@ -78,6 +107,6 @@ def update_metadata_property(
 
     if response.status_code == 200:
         response_obj = Response.from_httpx_response(response)
-        response_obj.parsed = FeedbackMetadataPropertyModel.parse_raw(response.content)
+        response_obj.parsed = FeedbackMetadataPropertyModel.parse_obj(json_loads(response.content))
         return response_obj
     return handle_response_error(response)
@@ -23,6 +23,11 @@ from argilla import FeedbackDataset, FeedbackRecord, Workspace
 from argilla.client.feedback.dataset.remote.dataset import RemoteFeedbackDataset
 from argilla.client.feedback.schemas import SuggestionSchema
 from argilla.client.feedback.schemas.remote.fields import RemoteTextField
+from argilla.client.feedback.schemas.remote.metadata import (
+    RemoteFloatMetadataProperty,
+    RemoteIntegerMetadataProperty,
+    RemoteTermsMetadataProperty,
+)
 from argilla.client.feedback.schemas.remote.questions import RemoteTextQuestion
 from argilla.client.feedback.schemas.remote.records import RemoteFeedbackRecord
 from argilla.client.feedback.schemas.vector_settings import VectorSettings
@@ -357,3 +362,35 @@ class TestSuiteRemoteDataset:
             url=f"/api/v1/datasets/{test_remote_dataset.id}/records",
             json={"items": [{"fields": {"text": "test"}, "suggestions": [], "vectors": {"vector-1": [1.0, 2.0, 3.0]}}]},
         )
+
+    def test_delete_metadata_properties(
+        self,
+        mocker: MockerFixture,
+        mock_httpx_client: httpx.Client,
+        test_remote_dataset: RemoteFeedbackDataset,
+        test_remote_record: RemoteFeedbackRecord,
+    ) -> None:
+        configure_mock_routes(mock_httpx_client, create_mock_routes(test_remote_dataset, test_remote_record))
+        metadata_properties = [
+            RemoteTermsMetadataProperty(id=uuid4(), name="terms-metadata", values=["a", "b"]),
+            RemoteIntegerMetadataProperty(id=uuid4(), name="integer-metadata", min=0, max=10),
+            RemoteFloatMetadataProperty(id=uuid4(), name="float-metadata", min=0.0, max=1.0),
+        ]
+        mocker.patch.object(
+            RemoteFeedbackDataset,
+            "metadata_properties",
+            new_callable=mocker.PropertyMock,
+            return_value=metadata_properties,
+        )
+        mock_delete_metadata_properties = mocker.patch(
+            "argilla.client.feedback.dataset.remote.dataset.metadata_properties_api_v1.delete_metadata_properties"
+        )
+
+        deleted_metadata_properties = test_remote_dataset.delete_metadata_properties(
+            ["float-metadata", "terms-metadata"]
+        )
+
+        mock_delete_metadata_properties.assert_called_once_with(
+            client=test_remote_dataset._client, ids=[metadata_properties[0].id, metadata_properties[2].id]
+        )
+        assert deleted_metadata_properties == [metadata_properties[0], metadata_properties[2]]
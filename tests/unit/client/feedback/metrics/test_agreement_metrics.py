@@ -0,0 +1,108 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import itertools
+import random
+from typing import Any, Callable, List
+
+import pytest
+from argilla.client.feedback.metrics.agreement_metrics import (
+    KrippendorfAlpha,
+    NLTKAnnotationTaskMetric,
+    kendall_tau_dist,
+)
+from nltk.metrics.agreement import AnnotationTask
+from nltk.metrics.distance import binary_distance, interval_distance, masi_distance
+
+
+def _random_annotations(values: List[Any], num_items: int = 50, num_coders: int = 4, seed: int = 42):
+    rng = random.Random(seed)
+    data = []
+    for item in range(num_items):
+        for coder in rng.sample(range(num_coders), rng.randint(1, num_coders)):
+            data.append((f"user-{coder}", f"text-{item}", rng.choice(values)))
+    return data
+
+
+@pytest.mark.parametrize(
+    "values, distance_function",
+    [
+        (["a", "b", "c"], binary_distance),
+        ([1, 2, 3, 4, 5], interval_distance),
+        ([frozenset(["a"]), frozenset(["a", "b"]), frozenset(["b"]), frozenset(["a", "c"])], masi_distance),
+        (list(itertools.permutations((1, 2, 3))), kendall_tau_dist),
+    ],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_krippendorf_alpha_matches_nltk(values: List[Any], distance_function: Callable, seed: int) -> None:
+    data = _random_annotations(values, seed=seed)
+
+    expected = AnnotationTask(data=data, distance=distance_function).alpha()
+    result = KrippendorfAlpha(annotated_dataset=data, distance_function=distance_function).compute()
+
+    assert result == pytest.approx(expected)
+
+
+def test_krippendorf_alpha_with_a_single_label() -> None:
+    data = [("user-1", "text-1", "a"), ("user-2", "text-1", "a"), ("user-1", "text-2", "a")]
+
+    assert KrippendorfAlpha(annotated_dataset=data, distance_function=binary_distance).compute() == 1.0
+
+
+@pytest.mark.parametrize(
+    "data, match",
+    [
+        ([], "no data present"),
+        ([("user-1", "text-1", "a"), ("user-1", "text-1", "b")], "only one coder and item present"),
+    ],
+)
+def test_krippendorf_alpha_errors(data: List[Any], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        KrippendorfAlpha(annotated_dataset=data, distance_function=binary_distance).compute()
+
+
+@pytest.mark.parametrize("max_block_size", [1, 7, 100])
+def test_krippendorf_alpha_by_blocks_of_items(monkeypatch: pytest.MonkeyPatch, max_block_size: int) -> None:
+    monkeypatch.setenv("ARGILLA_METRICS_MAX_BLOCK_SIZE", str(max_block_size))
+    data = _random_annotations(["a", "b", "c"])
+
+    expected = AnnotationTask(data=data, distance=binary_distance).alpha()
+    result = KrippendorfAlpha(annotated_dataset=data, distance_function=binary_distance).compute()
+
+    assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("max_block_size", ["not-a-number", "0"])
+def test_krippendorf_alpha_with_invalid_block_size(monkeypatch: pytest.MonkeyPatch, max_block_size: str) -> None:
+    monkeypatch.setenv("ARGILLA_METRICS_MAX_BLOCK_SIZE", max_block_size)
+    data = _random_annotations(["a", "b", "c"])
+
+    expected = AnnotationTask(data=data, distance=binary_distance).alpha()
+    with pytest.warns(UserWarning, match="ARGILLA_METRICS_MAX_BLOCK_SIZE"):
+        result = KrippendorfAlpha(annotated_dataset=data, distance_function=binary_distance).compute()
+
+    assert result == pytest.approx(expected)
+
+
+def test_nltk_annotation_task_metric_is_deprecated() -> None:
+    class NLTKKrippendorfAlpha(NLTKAnnotationTaskMetric):
+        def _compute(self, data) -> float:
+            return self.alpha()
+
+    data = _random_annotations(["a", "b", "c"])
+
+    with pytest.warns(DeprecationWarning, match="NLTKAnnotationTaskMetric"):
+        metric = NLTKKrippendorfAlpha(annotated_dataset=data, distance_function=binary_distance)
+
+    assert metric.compute() == pytest.approx(AnnotationTask(data=data, distance=binary_distance).alpha())
@@ -0,0 +1,59 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import random
+from typing import Any, List
+
+import pytest
+from argilla.client.feedback.metrics.annotator_metrics import AccuracyMetric, ConfusionMatrixMetric
+from sklearn.metrics import accuracy_score, confusion_matrix
+
+
+def _random_responses_and_suggestions(labels: List[Any], num_responses: int = 200, seed: int = 42):
+    rng = random.Random(seed)
+    responses = [rng.choice(labels) for _ in range(num_responses)]
+    suggestions = [rng.choice(labels) for _ in range(num_responses)]
+    return responses, suggestions
+
+
+@pytest.mark.parametrize("labels", [["a", "b", "c"], [1, 2, 3, 4, 5]])
+def test_accuracy_and_confusion_matrix(labels: List[Any]) -> None:
+    responses, suggestions = _random_responses_and_suggestions(labels)
+
+    accuracy = AccuracyMetric(responses=responses, suggestions=suggestions).compute()
+    matrix = ConfusionMatrixMetric(responses=responses, suggestions=suggestions).compute()
+
+    assert accuracy == pytest.approx(accuracy_score(y_true=responses, y_pred=suggestions))
+    assert list(matrix.index) == [f"responses_{label}" for label in labels]
+    assert list(matrix.columns) == [f"suggestions_{label}" for label in labels]
+    assert (matrix.values == confusion_matrix(y_true=responses, y_pred=suggestions, labels=labels)).all()
+
+
+@pytest.mark.parametrize(
+    "responses, suggestions",
+    [([1, 2, 3, 2], [1, None, 3, 2]), ([1, None], [1, 2]), (["a", "b"], ["a", float("nan")]), ([1, 2, 3], [1, 2])],
+)
+def test_confusion_matrix_with_invalid_data(responses: List[Any], suggestions: List[Any]) -> None:
+    with pytest.raises(ValueError):
+        ConfusionMatrixMetric(responses=responses, suggestions=suggestions).compute()
+    with pytest.raises(ValueError):
+        AccuracyMetric(responses=responses, suggestions=suggestions).compute()
+
+
+def test_accuracy_with_labels_of_different_types() -> None:
+    responses, suggestions = [1, 2], ["1", "2"]
+
+    accuracy = AccuracyMetric(responses=responses, suggestions=suggestions).compute()
+
+    assert accuracy == 0.0
@@ -0,0 +1,37 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import httpx
+from argilla.client.sdk.client import DEFAULT_HTTP2, DEFAULT_HTTPX_LIMITS, Client
+
+
+class TestSuiteClient:
+    def test_httpx_client_defaults(self, mocker) -> None:
+        httpx_client_mock = mocker.patch("argilla.client.sdk.client.httpx.Client")
+
+        Client(base_url="http://localhost:6900")
+
+        _, kwargs = httpx_client_mock.call_args
+        assert kwargs["http2"] is DEFAULT_HTTP2
+        assert kwargs["limits"] is DEFAULT_HTTPX_LIMITS
+
+    def test_httpx_client_defaults_with_httpx_extra_kwargs(self, mocker) -> None:
+        httpx_client_mock = mocker.patch("argilla.client.sdk.client.httpx.Client")
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+
+        Client(base_url="http://localhost:6900", httpx_extra_kwargs={"http2": False, "limits": limits})
+
+        _, kwargs = httpx_client_mock.call_args
+        assert kwargs["http2"] is False
+        assert kwargs["limits"] is limits
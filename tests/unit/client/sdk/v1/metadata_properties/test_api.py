@@ -15,7 +15,7 @@
 from uuid import uuid4
 
 import httpx
-from argilla.client.sdk.v1.metadata_properties.api import update_metadata_property
+from argilla.client.sdk.v1.metadata_properties.api import delete_metadata_properties, update_metadata_property
 
 
 class TestSuiteMetadataPropertiesSDK:
@@ -49,3 +49,28 @@ class TestSuiteMetadataPropertiesSDK:
             url=f"/api/v1/metadata-properties/{metadata_property_id}",
             json={"title": "new-title", "visible_for_annotators": False},
         )
+
+    def test_delete_metadata_properties(self, mock_httpx_client: httpx.Client) -> None:
+        metadata_property_ids = [uuid4() for _ in range(3)]
+        mock_httpx_client.delete.side_effect = lambda url: httpx.Response(
+            status_code=200,
+            json={
+                "id": url.split("/")[-1],
+                "name": "metadata-property",
+                "title": "title",
+                "visible_for_annotators": True,
+                "settings": {"type": "integer", "min": 0, "max": 10},
+                "inserted_at": "2021-09-13T12:00:00Z",
+                "updated_at": "2021-09-13T12:00:00Z",
+            },
+        )
+
+        responses = delete_metadata_properties(client=mock_httpx_client, ids=metadata_property_ids)
+
+        assert [response.status_code for response in responses] == [200] * 3
+        assert [response.parsed.id for response in responses] == metadata_property_ids
+        assert mock_httpx_client.delete.call_count == 3
+
+    def test_delete_metadata_properties_without_ids(self, mock_httpx_client: httpx.Client) -> None:
+        assert delete_metadata_properties(client=mock_httpx_client, ids=[]) == []
+        mock_httpx_client.delete.assert_not_called()